@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from types import MappingProxyType
 
 from homeassistant.components.binary_sensor import (
     BinarySensorDeviceClass,
@@ -34,24 +35,26 @@ from .router import ARDevice
 
 _LOGGER = logging.getLogger(__name__)
 
-BINARY_SENSORS = {
-    (WAN, "status"): ARBinarySensorDescription(
-        key="status",
-        key_group=WAN,
-        name="WAN",
-        entity_category=EntityCategory.DIAGNOSTIC,
-        device_class=BinarySensorDeviceClass.CONNECTIVITY,
-        entity_registry_enabled_default=True,
-        extra_state_attributes={
-            "dns": "dns",
-            "gateway": "gateway",
-            "ip": "ip",
-            "ip_type": "ip_type",
-            "mask": "mask",
-            "private_subnet": "private_subnet",
-        },
-    ),
-}
+BINARY_SENSORS = MappingProxyType(
+    {
+        (WAN, "status"): ARBinarySensorDescription(
+            key="status",
+            key_group=WAN,
+            name="WAN",
+            entity_category=EntityCategory.DIAGNOSTIC,
+            device_class=BinarySensorDeviceClass.CONNECTIVITY,
+            entity_registry_enabled_default=True,
+            extra_state_attributes={
+                "dns": "dns",
+                "gateway": "gateway",
+                "ip": "ip",
+                "ip_type": "ip_type",
+                "mask": "mask",
+                "private_subnet": "private_subnet",
+            },
+        ),
+    }
+)
 BINARY_SENSORS_PARENTAL_CONTROL = {
     (PARENTAL_CONTROL, "state"): ARBinarySensorDescription(
         key="state",
@@ -75,20 +78,21 @@ async def async_setup_entry(
 ) -> None:
     """Setup AsusRouter binary sensors."""
 
-    hide = list()
-    if entry.options.get(CONF_HIDE_PASSWORDS, DEFAULT_HIDE_PASSWORDS):
-        hide.append(PASSWORD)
+    hide = (
+        (PASSWORD,)
+        if entry.options.get(CONF_HIDE_PASSWORDS, DEFAULT_HIDE_PASSWORDS)
+        else ()
+    )
 
+    sensors = dict(BINARY_SENSORS)
     if not entry.options[CONF_ENABLE_CONTROL]:
-        BINARY_SENSORS.update(list_sensors_vpn_clients(5))
-        BINARY_SENSORS.update(list_sensors_vpn_servers(5))
-        BINARY_SENSORS.update(list_sensors_wlan(3, hide))
-        BINARY_SENSORS.update(list_sensors_gwlan(3, hide))
-        BINARY_SENSORS.update(BINARY_SENSORS_PARENTAL_CONTROL)
+        sensors.update(list_sensors_vpn_clients(5))
+        sensors.update(list_sensors_vpn_servers(5))
+        sensors.update(list_sensors_wlan(3, hide))
+        sensors.update(list_sensors_gwlan(3, hide))
+        sensors.update(BINARY_SENSORS_PARENTAL_CONTROL)
 
-    await async_setup_ar_entry(
-        hass, entry, async_add_entities, BINARY_SENSORS, ARBinarySensor
-    )
+    await async_setup_ar_entry(hass, entry, async_add_entities, sensors, ARBinarySensor)
 
 
 class ARBinarySensor(ARBinaryEntity, BinarySensorEntity):
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.binary_sensor import DEVICE_CLASS_CONNECTIVITY
@@ -81,13 +83,16 @@ def list_sensors_network(
     return sensors
 
 
-def list_sensors_vpn_clients(number: int | None = None) -> dict[str, Any]:
+@lru_cache(maxsize=8)
+def list_sensors_vpn_clients(
+    number: int | None = None,
+) -> MappingProxyType[Any, Any]:
     """Compile a list of vpn sensors."""
 
     sensors = dict()
 
     if not number:
-        return sensors
+        return MappingProxyType(sensors)
 
     for num in range(1, number + 1):
         vpn = f"{KEY_OVPN_CLIENT}{num}"
@@ -107,7 +112,7 @@ def list_sensors_vpn_clients(number: int | None = None) -> dict[str, Any]:
             }
         )
 
-    return sensors
+    return MappingProxyType(sensors)
 
 
 def list_switches_vpn_clients(number: int | None = None) -> dict[str, Any]:
@@ -144,13 +149,16 @@ def list_switches_vpn_clients(number: int | None = None) -> dict[str, Any]:
     return sensors
 
 
-def list_sensors_vpn_servers(number: int | None = None) -> dict[str, Any]:
+@lru_cache(maxsize=8)
+def list_sensors_vpn_servers(
+    number: int | None = None,
+) -> MappingProxyType[Any, Any]:
     """Compile a list of vpn sensors."""
 
     sensors = dict()
 
     if not number:
-        return sensors
+        return MappingProxyType(sensors)
 
     for num in range(1, number + 1):
         vpn = f"{KEY_OVPN_SERVER}{num}"
@@ -170,7 +178,7 @@ def list_sensors_vpn_servers(number: int | None = None) -> dict[str, Any]:
             }
         )
 
-    return sensors
+    return MappingProxyType(sensors)
 
 
 def list_switches_vpn_servers(number: int | None = None) -> dict[str, Any]:
@@ -207,15 +215,16 @@ def list_switches_vpn_servers(number: int | None = None) -> dict[str, Any]:
     return sensors
 
 
+@lru_cache(maxsize=8)
 def list_sensors_wlan(
-    number: int | None = None, hide: list[str] = list()
-) -> dict[str, Any]:
+    number: int | None = None, hide: tuple[str, ...] = ()
+) -> MappingProxyType[Any, Any]:
     """Compile a list of wlan sensors."""
 
     sensors = dict()
 
     if not number:
-        return sensors
+        return MappingProxyType(sensors)
 
     for id in range(0, number + 1):
         wlan = f"{KEY_WLAN}{id}"
@@ -236,11 +245,11 @@ def list_sensors_wlan(
             }
         )
 
-    return sensors
+    return MappingProxyType(sensors)
 
 
 def list_switches_wlan(
-    number: int | None = None, hide: list[str] = list()
+    number: int | None = None, hide: tuple[str, ...] = ()
 ) -> dict[str, Any]:
     """Compile a list of wlan switches."""
 
@@ -290,15 +299,16 @@ def list_switches_wlan(
     return sensors
 
 
+@lru_cache(maxsize=8)
 def list_sensors_gwlan(
-    number: int | None = None, hide: list[str] = list()
-) -> dict[str, Any]:
+    number: int | None = None, hide: tuple[str, ...] = ()
+) -> MappingProxyType[Any, Any]:
     """Compile a list of gwlan sensors."""
 
     sensors = dict()
 
     if not number:
-        return sensors
+        return MappingProxyType(sensors)
 
     for idm in range(0, number + 1):
         for ida in range(1, number + 2):
@@ -321,11 +331,11 @@ def list_sensors_gwlan(
                 }
             )
 
-    return sensors
+    return MappingProxyType(sensors)
 
 
 def list_switches_gwlan(
-    number: int | None = None, hide: list[str] = list()
+    number: int | None = None, hide: tuple[str, ...] = ()
 ) -> dict[str, Any]:
     """Compile a list of gwlan switches."""
 
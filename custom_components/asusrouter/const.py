@@ -311,6 +311,7 @@ DEFAULT_UNITS_SPEED = DATA_RATE_MEGABITS_PER_SECOND
 DEFAULT_UNITS_TRAFFIC = DATA_GIGABYTES
 DEFAULT_USERNAME = "admin"
 DEFAULT_VERIFY_SSL = True
+MIN_UPDATE_INTERVAL = 1
 
 # Simplified setup
 SIMPLE_SETUP_PARAMETERS = {
@@ -381,6 +382,13 @@ CONNECTION_TYPE_5G2 = CONNECTION_5G2
 CONNECTION_TYPE_6G = CONNECTION_6G
 CONNECTION_TYPE_WIRED = CONNECTION_WIRED
 CONNECTION_TYPE_UNKNOWN = UNKNOWN
+CONNECTION_TYPE_MAP: dict[int, str] = {
+    0: CONNECTION_TYPE_WIRED,
+    1: CONNECTION_TYPE_2G,
+    2: CONNECTION_TYPE_5G,
+    3: CONNECTION_TYPE_5G2,
+    4: CONNECTION_TYPE_6G,
+}
 
 # Device attributes
 DEVICE_ATTRIBUTE_CONNECTION_TIME = "connection_time"
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import asyncio
+from bisect import bisect_left, insort
+from collections import deque
 from datetime import datetime, timedelta
 import logging
 from typing import Any, Awaitable, Callable, TypeVar
@@ -15,6 +18,7 @@ from homeassistant.const import (
     CONF_PORT,
     CONF_SCAN_INTERVAL,
     CONF_VERIFY_SSL,
+    MATCH_ALL,
     Platform,
 )
 from homeassistant.core import CALLBACK_TYPE, HomeAssistant, ServiceCall, callback
@@ -41,12 +45,8 @@ from .const import (
     CONF_SPLIT_INTERVALS,
     CONF_TRACK_DEVICES,
     CONNECTED,
-    CONNECTION_TYPE_2G,
-    CONNECTION_TYPE_5G,
-    CONNECTION_TYPE_5G2,
-    CONNECTION_TYPE_6G,
+    CONNECTION_TYPE_MAP,
     CONNECTION_TYPE_UNKNOWN,
-    CONNECTION_TYPE_WIRED,
     DEFAULT_CONSIDER_HOME,
     DEFAULT_HTTP,
     DEFAULT_INTERVALS,
@@ -73,6 +73,7 @@ from .const import (
     IP,
     KEY_COORDINATOR,
     MAC,
+    MIN_UPDATE_INTERVAL,
     NAME,
     SENSORS_CONNECTED_DEVICES,
 )
@@ -103,6 +104,7 @@ class ARSensorHandler:
         self._split_intervals = options.get(
             CONF_SPLIT_INTERVALS, DEFAULT_SPLIT_INTERVALS
         )
+        self._scan_interval = options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
 
     async def _get_connected_devices(self) -> dict[str, int]:
         """Return number of connected devices."""
@@ -120,21 +122,13 @@ class ARSensorHandler:
         list_devices: list[str],
         latest_connected: datetime | None,
         latest_connected_list: list[Any],
-    ) -> bool:
+    ) -> None:
         """Update connected devices attribute."""
 
-        if (
-            self._connected_devices == conn_devices
-            and self._connected_devices_list == list_devices
-            and self._latest_connected == latest_connected
-            and self._latest_connected_list == latest_connected_list
-        ):
-            return False
         self._connected_devices = conn_devices
         self._connected_devices_list = list_devices
         self._latest_connected = latest_connected
         self._latest_connected_list = latest_connected_list
-        return True
 
     async def get_coordinator(
         self,
@@ -160,15 +154,14 @@ class ARSensorHandler:
                     DEFAULT_INTERVALS[CONF_INTERVAL + sensor_type],
                 )
             )
-        else:
+        elif self._split_intervals:
             interval = timedelta(
                 seconds=self._options.get(
-                    CONF_INTERVAL + sensor_type,
-                    self._options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+                    CONF_INTERVAL + sensor_type, self._scan_interval
                 )
-                if self._options.get(CONF_SPLIT_INTERVALS, DEFAULT_SPLIT_INTERVALS)
-                else self._options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
             )
+        else:
+            interval = timedelta(seconds=self._scan_interval)
 
         coordinator = DataUpdateCoordinator(
             self._hass,
@@ -177,6 +170,10 @@ class ARSensorHandler:
             update_method=method,
             update_interval=interval if should_poll else None,
         )
+        if should_poll:
+            coordinator.update_method = self._compensate_drift(
+                coordinator, method, interval
+            )
         _LOGGER.debug(
             f"Coordinator initialized for `{sensor_type}`. Update interval: `{interval}`"
         )
@@ -184,10 +181,47 @@ class ARSensorHandler:
 
         return coordinator
 
+    def _compensate_drift(
+        self,
+        coordinator: DataUpdateCoordinator,
+        method: Callable[[], Awaitable[_T]],
+        interval: timedelta,
+    ) -> Callable[[], Awaitable[_T]]:
+        """Wrap update method to keep the polling period close to the interval.
+
+        The next update is scheduled from the end of the current one, with the
+        time already floored to the second by the coordinator, so only the whole
+        seconds crossed by the update are subtracted from the next interval.
+        """
+
+        async def timed_method() -> _T:
+            start = int(dt_util.utcnow().timestamp())
+            try:
+                return await method()
+            finally:
+                crossed = int(dt_util.utcnow().timestamp()) - start
+                coordinator.update_interval = max(
+                    timedelta(seconds=MIN_UPDATE_INTERVAL),
+                    interval - timedelta(seconds=crossed),
+                )
+
+        return timed_method
+
 
 class ARConnectedDevice:
     """Representation of an AsusRouter device info."""
 
+    __slots__ = (
+        "_mac",
+        "_name",
+        "_ip",
+        "identity",
+        "_connected",
+        "_extra_state_attributes",
+    )
+
+    _RESET_TEMPLATE: dict[str, None] = dict.fromkeys(DEVICE_ATTRIBUTES, None)
+
     def __init__(
         self,
         mac: str,
@@ -216,64 +250,41 @@ class ARConnectedDevice:
         consider_home: int = 0,
         event_call: CALLBACK_TYPE | None = None,
         connected_call: CALLBACK_TYPE | None = None,
+        state_call: CALLBACK_TYPE | None = None,
     ):
         """Update AsusRouter device info."""
 
+        # Not reported by the router and already disconnected
+        if not dev_info and not self._connected:
+            return
+
         utc_point_in_time = dt_util.utcnow()
 
         if dev_info:
-            self._name = dev_info.name
-            self.identity[NAME] = self._name
+            self._name = self.identity[NAME] = dev_info.name
             # Online
             if dev_info.online:
-                self._ip = dev_info.ip
-                self.identity[IP] = self._ip
+                self._ip = self.identity[IP] = dev_info.ip
                 # Connection time
+                connected_since = dev_info.connected_since
                 self._extra_state_attributes[
                     DEVICE_ATTRIBUTE_CONNECTION_TIME
-                ] = dev_info.connected_since
+                ] = connected_since
                 self.identity[CONNECTED] = (
-                    dev_info.connected_since
-                    or self.identity[CONNECTED]
-                    or utc_point_in_time
+                    connected_since or self.identity[CONNECTED] or utc_point_in_time
                 )
                 # Connection type
-                con_type = dev_info.connection_type
-                if con_type == 0:
-                    self._extra_state_attributes[
-                        DEVICE_ATTRIBUTE_CONNECTION_TYPE
-                    ] = CONNECTION_TYPE_WIRED
-                elif con_type == 1:
-                    self._extra_state_attributes[
-                        DEVICE_ATTRIBUTE_CONNECTION_TYPE
-                    ] = CONNECTION_TYPE_2G
-                elif con_type == 2:
-                    self._extra_state_attributes[
-                        DEVICE_ATTRIBUTE_CONNECTION_TYPE
-                    ] = CONNECTION_TYPE_5G
-                elif con_type == 3:
-                    self._extra_state_attributes[
-                        DEVICE_ATTRIBUTE_CONNECTION_TYPE
-                    ] = CONNECTION_TYPE_5G2
-                elif con_type == 4:
-                    self._extra_state_attributes[
-                        DEVICE_ATTRIBUTE_CONNECTION_TYPE
-                    ] = CONNECTION_TYPE_6G
-                else:
-                    self._extra_state_attributes[
-                        DEVICE_ATTRIBUTE_CONNECTION_TYPE
-                    ] = CONNECTION_TYPE_UNKNOWN
-                # Add connection type to identity
-                self.identity[
+                connection_type = CONNECTION_TYPE_MAP.get(
+                    dev_info.connection_type, CONNECTION_TYPE_UNKNOWN
+                )
+                self._extra_state_attributes[
                     DEVICE_ATTRIBUTE_CONNECTION_TYPE
-                ] = self._extra_state_attributes[DEVICE_ATTRIBUTE_CONNECTION_TYPE]
+                ] = connection_type
+                self.identity[DEVICE_ATTRIBUTE_CONNECTION_TYPE] = connection_type
                 # Guest network
-                self._extra_state_attributes[DEVICE_ATTRIBUTE_GUEST] = (
-                    True if dev_info.guest else False
-                )
-                self.identity[DEVICE_ATTRIBUTE_GUEST] = self._extra_state_attributes[
-                    DEVICE_ATTRIBUTE_GUEST
-                ]
+                guest = bool(dev_info.guest)
+                self._extra_state_attributes[DEVICE_ATTRIBUTE_GUEST] = guest
+                self.identity[DEVICE_ATTRIBUTE_GUEST] = guest
                 # Internet
                 self._extra_state_attributes[
                     DEVICE_ATTRIBUTE_INTERNET_MODE
@@ -305,7 +316,11 @@ class ARConnectedDevice:
                         self.identity,
                     )
                     if connected_call:
-                        connected_call(self.identity)
+                        connected_call(
+                            self.identity, connected_since or utc_point_in_time
+                        )
+                    if state_call:
+                        state_call(self._mac, True)
                 # Set state
                 self._connected = True
             # Offline
@@ -325,13 +340,14 @@ class ARConnectedDevice:
                         CONF_EVENT_DEVICE_DISCONNECTED,
                         self.identity,
                     )
+                    if state_call:
+                        state_call(self._mac, False)
+                    # Reset attributes (already reset if disconnected before)
+                    self._extra_state_attributes.update(self._RESET_TEMPLATE)
                 # Reset state
                 self._connected = False
                 # Reset IP
                 self._ip = None
-                # Reset attributes
-                for el in DEVICE_ATTRIBUTES:
-                    self._extra_state_attributes[el] = None
         elif self._connected:
             # Reset state if needed
             self._connected = (
@@ -343,11 +359,12 @@ class ARConnectedDevice:
                     CONF_EVENT_DEVICE_DISCONNECTED,
                     self.identity,
                 )
+                if state_call:
+                    state_call(self._mac, False)
             # Reset IP
             self._ip = None
             ## Reset attributes
-            for el in DEVICE_ATTRIBUTES:
-                self._extra_state_attributes[el] = None
+            self._extra_state_attributes.update(self._RESET_TEMPLATE)
 
     @property
     def is_connected(self):
@@ -411,11 +428,22 @@ class ARDevice:
         self._identity: AsusDevice | None = None
 
         self._devices: dict[str, Any] = {}
+        self._mac_format_cache: dict[str, str] = {}
         self._connected_devices: int = 0
         self._connected_devices_list: list[str] = list()
+        self._connected_set: set[str] = set()
+        self._connected_changed: bool = False
+        self._state_version: int = 0
+        self._last_pushed_version: int = 0
         self._latest_connected: datetime | None = None
         self._latest_connected_list: list[Any] = list()
+        self._latest_connected_sorted: deque[tuple[datetime, str, Any]] = deque(
+            maxlen=self._options.get(CONF_LATEST_CONNECTED, DEFAULT_LATEST_CONNECTED)
+        )
+        self._latest_connected_entries: dict[str, tuple[datetime, str, Any]] = {}
         self._connect_error: bool = False
+        self._event_listeners: dict[str, int] | None = None
+        self._update_devices_task: asyncio.Task | None = None
 
         self._sensor_handler: ARSensorHandler | None = None
         self._sensor_coordinator: dict[str, Any] = {}
@@ -474,16 +502,17 @@ class ARDevice:
         track_entries = er.async_entries_for_config_entry(
             entity_reg, self._entry.entry_id
         )
+        track_entries = [
+            entry for entry in track_entries if entry.domain == TRACKER_DOMAIN
+        ]
         for entry in track_entries:
 
-            if entry.domain != TRACKER_DOMAIN:
-                continue
             device_mac = format_mac(entry.unique_id)
 
             # migrate entity unique ID if wrong formatted
             if device_mac != entry.unique_id:
                 existing_entity_id = entity_reg.async_get_entity_id(
-                    DOMAIN, TRACKER_DOMAIN, device_mac
+                    TRACKER_DOMAIN, DOMAIN, device_mac
                 )
                 if existing_entity_id:
                     # entity with uniqueid properly formatted already
@@ -526,6 +555,19 @@ class ARDevice:
         await self.update_devices()
 
     async def update_devices(self) -> None:
+        """Update AsusRouter devices tracker.
+
+        Calls made while an update is already running wait for that update
+        instead of starting a new one.
+        """
+
+        if self._update_devices_task is None or self._update_devices_task.done():
+            self._update_devices_task = self.hass.async_create_task(
+                self._async_update_devices()
+            )
+        await asyncio.shield(self._update_devices_task)
+
+    async def _async_update_devices(self) -> None:
         """Update AsusRouter devices tracker."""
 
         if self._options.get(CONF_TRACK_DEVICES, DEFAULT_TRACK_DEVICES) == False:
@@ -551,28 +593,46 @@ class ARDevice:
 
         consider_home = self._options.get(CONF_CONSIDER_HOME, DEFAULT_CONSIDER_HOME)
 
-        wrt_devices = {format_mac(mac): dev for mac, dev in api_devices.items()}
-        for device_mac, device in self._devices.items():
-            dev_info = wrt_devices.pop(device_mac, None)
-            device.update(
-                dev_info,
-                consider_home,
-                event_call=self.fire_event,
-                connected_call=self.connected_device,
-            )
+        # Listeners of HA events are looked up again on the first event
+        self._event_listeners = None
 
         new_devices = list()
-
-        for device_mac, dev_info in wrt_devices.items():
+        seen: set[str] = set()
+
+        for mac, dev_info in api_devices.items():
+            device_mac = self._format_mac(mac)
+            seen.add(device_mac)
+            device = self._devices.get(device_mac)
+            if device is not None:
+                device.update(
+                    dev_info,
+                    consider_home,
+                    event_call=self.fire_event,
+                    connected_call=self.connected_device,
+                    state_call=self.device_state,
+                )
+                continue
             new_device = True
             device = ARConnectedDevice(device_mac)
             device.update(
                 dev_info,
                 event_call=self.fire_event,
                 connected_call=self.connected_device,
+                state_call=self.device_state,
             )
             self._devices[device_mac] = device
             new_devices.append(device)
+            self._state_version += 1
+
+        # Devices not reported by the router
+        for device_mac in self._devices.keys() - seen:
+            self._devices[device_mac].update(
+                None,
+                consider_home,
+                event_call=self.fire_event,
+                connected_call=self.connected_device,
+                state_call=self.device_state,
+            )
 
         for device in new_devices:
             self.fire_event(
@@ -581,18 +641,29 @@ class ARDevice:
             )
 
         # Connected devices sensor
-        self._connected_devices = 0
-        self._connected_devices_list = list()
-        for mac, device in self._devices.items():
-            if device.is_connected:
-                self._connected_devices += 1
-                self._connected_devices_list.append(device.identity)
+        if self._connected_changed:
+            self._connected_changed = False
+            self._connected_devices = len(self._connected_set)
+            self._connected_devices_list = [
+                device.identity
+                for mac, device in self._devices.items()
+                if mac in self._connected_set
+            ]
 
         async_dispatcher_send(self.hass, self.signal_device_update)
         if new_device:
             async_dispatcher_send(self.hass, self.signal_device_new)
         await self._update_unpolled_sensors()
 
+    def _format_mac(self, mac: str) -> str:
+        """Format MAC address using the cache of already formatted values."""
+
+        formatted = self._mac_format_cache.get(mac)
+        if formatted is None:
+            formatted = format_mac(mac)
+            self._mac_format_cache[mac] = formatted
+        return formatted
+
     async def init_sensors_coordinator(self) -> None:
         """Initialize AsusRouter sensors coordinators."""
 
@@ -606,6 +677,7 @@ class ARDevice:
             self._latest_connected,
             self._latest_connected_list,
         )
+        self._last_pushed_version = self._state_version
 
         available_sensors = await self.bridge.async_get_available_sensors()
         available_sensors[DEVICES] = {"sensors": SENSORS_CONNECTED_DEVICES}
@@ -627,15 +699,20 @@ class ARDevice:
         if not self._sensor_handler:
             return
 
+        # Nothing changed since the last push
+        if self._state_version == self._last_pushed_version:
+            return
+
         if DEVICES in self._sensor_coordinator:
             coordinator = self._sensor_coordinator[DEVICES][KEY_COORDINATOR]
-            if self._sensor_handler.update_device_count(
+            self._sensor_handler.update_device_count(
                 self._connected_devices,
                 self._connected_devices_list,
                 self._latest_connected,
                 self._latest_connected_list,
-            ):
-                await coordinator.async_refresh()
+            )
+            await coordinator.async_refresh()
+            self._last_pushed_version = self._state_version
 
     async def close(self) -> None:
         """Close the connection."""
@@ -672,17 +749,26 @@ class ARDevice:
                     break
 
         self._options.update(new_options)
-        return req_reload
 
-    def connected_device_time(self, element: dict[str, Any]) -> datetime:
-        """Get connected time for the device"""
+        # Resize latest connected devices list, keeping the newest entries
+        latest_size = self._options.get(CONF_LATEST_CONNECTED, DEFAULT_LATEST_CONNECTED)
+        if latest_size != self._latest_connected_sorted.maxlen:
+            self._latest_connected_sorted = deque(
+                self._latest_connected_sorted, maxlen=latest_size
+            )
+            self._latest_connected_entries = {
+                item[1]: item for item in self._latest_connected_sorted
+            }
+            self._update_latest_connected()
+            self._state_version += 1
 
-        return element.get(CONNECTED)
+        return req_reload
 
     @callback
     def connected_device(
         self,
         identity: dict[str, Any],
+        connected_time: datetime | None = None,
     ) -> None:
         """Mark device connected."""
 
@@ -691,24 +777,51 @@ class ARDevice:
             return
 
         # If device already in list
-        for device in self._latest_connected_list:
-            if device.get(MAC, None) == mac:
-                self._latest_connected_list.remove(device)
-
-        # Sort the list by time
-        self._latest_connected_list.sort(key=self.connected_device_time)
-
-        # Add new identity
-        self._latest_connected_list.append(identity)
+        entry = self._latest_connected_entries.pop(mac, None)
+        if entry is not None:
+            del self._latest_connected_sorted[
+                bisect_left(self._latest_connected_sorted, entry)
+            ]
+
+        # Add new identity in the order of connection time.
+        # A full deque does not accept inserts, so the oldest entry is evicted
+        # first, unless the new entry would be the oldest one itself
+        latest = self._latest_connected_sorted
+        entry = (connected_time or dt_util.utcnow(), mac, identity)
+        if len(latest) < latest.maxlen or (latest and latest[0] < entry):
+            if len(latest) == latest.maxlen:
+                self._latest_connected_entries.pop(latest.popleft()[1], None)
+            insort(latest, entry)
+            self._latest_connected_entries[mac] = entry
+
+        self._update_latest_connected()
+
+    def _update_latest_connected(self) -> None:
+        """Update latest connected devices list and time."""
+
+        self._latest_connected_list = [
+            item[2] for item in self._latest_connected_sorted
+        ]
+        self._latest_connected = (
+            self._latest_connected_sorted[-1][0]
+            if self._latest_connected_sorted
+            else None
+        )
 
-        # Check the size
-        while len(self._latest_connected_list) > self._options.get(
-            CONF_LATEST_CONNECTED, DEFAULT_LATEST_CONNECTED
-        ):
-            self._latest_connected_list.pop(0)
+    @callback
+    def device_state(
+        self,
+        mac: str,
+        connected: bool,
+    ) -> None:
+        """Track device connected state change."""
 
-        # Update latest connected time
-        self._latest_connected = self._latest_connected_list[-1].get(CONNECTED)
+        if connected:
+            self._connected_set.add(mac)
+        else:
+            self._connected_set.discard(mac)
+        self._connected_changed = True
+        self._state_version += 1
 
     @callback
     def fire_event(
@@ -717,8 +830,19 @@ class ARDevice:
         args: dict[str | Any] | None = None,
     ):
         """Fire HA event."""
+
+        # Skip events nobody listens to
+        if self._event_listeners is None:
+            self._event_listeners = self.hass.bus.async_listeners()
+        event_type = f"{DOMAIN}_{event}"
+        if not (
+            self._event_listeners.get(event_type)
+            or self._event_listeners.get(MATCH_ALL)
+        ):
+            return
+
         self.hass.bus.fire(
-            f"{DOMAIN}_{event}",
+            event_type,
             args,
         )
 
@@ -740,6 +864,7 @@ class ARDevice:
                 _LOGGER.debug(f"Trying to remove tracker with mac: {mac}")
                 if mac in self._devices:
                     self._devices.pop(mac)
+                    self.device_state(mac, False)
                     _LOGGER.debug("Found and removed")
 
         await self.update_devices()
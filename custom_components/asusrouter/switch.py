@@ -65,9 +65,11 @@ async def async_setup_entry(
 ) -> None:
     """Setup AsusRouter switches."""
 
-    hide = list()
-    if entry.options.get(CONF_HIDE_PASSWORDS, DEFAULT_HIDE_PASSWORDS):
-        hide.append(PASSWORD)
+    hide = (
+        (PASSWORD,)
+        if entry.options.get(CONF_HIDE_PASSWORDS, DEFAULT_HIDE_PASSWORDS)
+        else ()
+    )
 
     if entry.options[CONF_ENABLE_CONTROL]:
         SWITCHES.update(list_switches_vpn_clients(5))